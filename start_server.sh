@@ -14,6 +14,9 @@ fi
 mkdir -p logs
 echo "Installing dependencies..."
 pip install -r requirements.txt
+if [ -z "$CORS_ORIGINS" ]; then
+  echo "WARNING: CORS_ORIGINS is not set; only localhost dev origins will be allowed (see README)"
+fi
 echo "Starting FastAPI server..."
-nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload > logs/server.log 2>&1 
+nohup uvicorn main:app --host 0.0.0.0 --port 8000 --loop auto --http httptools --reload > logs/server.log 2>&1 
 echo "Server started in background"